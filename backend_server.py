@@ -1,15 +1,18 @@
 # backend_server.py - Updated with Stacks blockchain integration
 from flask import Flask, request, jsonify, render_template_string
+from flask.json.provider import JSONProvider, DefaultJSONProvider
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import Pipeline
 import joblib
-import re
+import math
 import hashlib
 import json
+from operator import itemgetter
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
@@ -17,19 +20,81 @@ from email.mime.multipart import MIMEMultipart
 import requests
 import os
 import sqlite3
+import threading
+import time
+import atexit
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from dotenv import load_dotenv
 
+try:
+    import treelite
+    import treelite.gtil
+except ImportError:  # Optional: native forest inference, sklearn is used otherwise
+    treelite = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON responses, Flask's encoder is used otherwise
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+class ORJSONProvider(JSONProvider):
+    """Serialize API payloads with orjson, including numpy values"""
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson else 0
+    
+    @staticmethod
+    def fallback_default(o):
+        """Encode numpy and Flask-supported values for the stdlib encoder"""
+        if isinstance(o, (np.generic, np.ndarray)):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+    
+    def encode(self, obj):
+        """Serialize obj to JSON bytes"""
+        try:
+            return orjson.dumps(obj, option=self.OPTIONS)
+        except orjson.JSONEncodeError:
+            # Values orjson rejects, such as integers beyond 64 bits, use the stdlib encoder
+            return json.dumps(obj, default=self.fallback_default).encode()
+    
+    def dumps(self, obj, **kwargs):
+        return self.encode(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response without a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.encode(obj), mimetype='application/json')
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 CORS(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DATABASE_PATH = 'blockchain_records.db'
+
+_db_local = threading.local()
+
+def get_db_connection():
+    """Get the SQLite connection for the current thread, opening it on first use"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_PATH)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        _db_local.conn = conn
+    return conn
+
 class StacksBlockchainManager:
     def __init__(self):
         # Stacks blockchain configuration
@@ -51,9 +116,11 @@ class StacksBlockchainManager:
             }
             
             # For demo purposes, simulate the transaction
-            tx_hash = hashlib.sha256(
-                f"{function_name}{json.dumps(function_args)}{datetime.now()}".encode()
-            ).hexdigest()
+            tx_hasher = hashlib.blake2b(digest_size=32)
+            tx_hasher.update(function_name.encode())
+            tx_hasher.update(json.dumps(function_args).encode())
+            tx_hasher.update(datetime.now().isoformat().encode())
+            tx_hash = tx_hasher.hexdigest()
             
             # Store in local database
             self.store_local_record(function_name, function_args, tx_hash)
@@ -102,7 +169,7 @@ class StacksBlockchainManager:
         """Get report from blockchain (read-only)"""
         try:
             # For demo, retrieve from local database
-            conn = sqlite3.connect('blockchain_records.db')
+            conn = get_db_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -111,19 +178,14 @@ class StacksBlockchainManager:
             ''', (report_id,))
             
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 return {
                     'success': True,
                     'report': {
-                        'platform': result[1],
-                        'username': result[2],
-                        'risk_score': result[3],
-                        'evidence': result[4],
-                        'tx_hash': result[5],
-                        'timestamp': result[6],
-                        'report_id': result[7]
+                        key: result[key]
+                        for key in ('platform', 'username', 'risk_score', 'evidence',
+                                    'tx_hash', 'timestamp', 'report_id')
                     }
                 }
             else:
@@ -133,33 +195,13 @@ class StacksBlockchainManager:
             return {'success': False, 'error': str(e)}
     
     def store_local_record(self, function_name, args, tx_hash):
-        """Store blockchain interaction in local database"""
-        conn = sqlite3.connect('blockchain_records.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS blockchain_transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                function_name TEXT,
-                args TEXT,
-                tx_hash TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                status TEXT DEFAULT 'pending'
-            )
-        ''')
-        
-        cursor.execute('''
-            INSERT INTO blockchain_transactions (function_name, args, tx_hash)
-            VALUES (?, ?, ?)
-        ''', (function_name, json.dumps(args), tx_hash))
+        """Queue blockchain interaction for the batched local database writer"""
+        transaction_row = (function_name, json.dumps(args), tx_hash)
+        report_row = None
         
         # Also store in fake_account_reports if it's a report function
         if function_name == 'report-fake-account' and len(args) >= 5:
-            cursor.execute('''
-                INSERT INTO fake_account_reports 
-                (platform, username, risk_score, evidence, tx_hash, report_id, agency, priority, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            report_row = (
                 args[0]['value'],  # platform
                 args[1]['value'],  # username
                 args[2]['value'] / 100.0,  # risk_score (convert back to 0-1)
@@ -169,66 +211,122 @@ class StacksBlockchainManager:
                 'itbp',  # default agency
                 'medium',  # default priority
                 'recorded'
-            ))
+            )
         
-        conn.commit()
-        conn.close()
+        enqueue_local_record(transaction_row, report_row)
+
+# Model input columns, in the order the pipeline is trained on
+FEATURE_COLUMNS = (
+    'followers_count', 'following_count', 'posts_count', 'account_age_days',
+    'profile_pic', 'bio_length', 'verified', 'username_digits',
+    'engagement_rate', 'posting_frequency'
+)
+get_feature_values = itemgetter(*FEATURE_COLUMNS)
 
 class MLFakeAccountDetector:
     def __init__(self):
-        self.profile_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
+        # Scaling and classification run as one sklearn pipeline. Bounded depth
+        # and leaf size keep the forest small for fast loads and inference.
+        self.profile_pipeline = Pipeline([
+            ('scaler', StandardScaler()),
+            ('classifier', RandomForestClassifier(
+                n_estimators=100, max_depth=12, min_samples_leaf=5, n_jobs=-1, random_state=42
+            ))
+        ])
         self.network_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
         self.behavior_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
         self.tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-        self.scaler = StandardScaler()
+        self.compiled_forest = None
         self.is_trained = False
+        self.load_models()
         
+    def load_models(self):
+        """Load previously trained models from disk if available"""
+        try:
+            profile_pipeline = joblib.load('fake_account_model.pkl')
+        except (FileNotFoundError, OSError) as e:
+            logger.info(f"No cached ML models found, training required: {e}")
+            return False
+        except Exception as e:
+            # Truncated files or pickles from another scikit-learn release fail to load
+            logger.warning(f"Cached ML model could not be loaded, training required: {e}")
+            return False
+
+        # Artifacts from older layouts (bare estimators) must be retrained
+        if not isinstance(profile_pipeline, Pipeline):
+            logger.warning("Cached ML model is not a scaling pipeline, training required")
+            return False
+        
+        if getattr(profile_pipeline, 'n_features_in_', None) != len(FEATURE_COLUMNS):
+            logger.warning("Cached ML model has a different feature layout, training required")
+            return False
+        
+        self.profile_pipeline = profile_pipeline
+        self.compile_forest()
+        self.is_trained = True
+        logger.info("Loaded cached ML models")
+        return True
+    
+    def compile_forest(self):
+        """Convert the trained forest for native treelite inference when available"""
+        self.compiled_forest = None
+        if treelite is None:
+            return
+        
+        try:
+            self.compiled_forest = treelite.sklearn.import_model(
+                self.profile_pipeline.named_steps['classifier']
+            )
+        except Exception as e:
+            logger.warning(f"Forest compilation failed, using sklearn inference: {e}")
+    
+    def predict_probabilities(self, feature_matrix):
+        """Predict class probabilities for a feature matrix"""
+        if self.compiled_forest is None:
+            return self.profile_pipeline.predict_proba(feature_matrix)
+        
+        # Trees compare float32 features, matching sklearn's own conversion
+        scaled = self.profile_pipeline[:-1].transform(feature_matrix).astype(np.float32)
+        probas = treelite.gtil.predict(self.compiled_forest, scaled, nthread=1)
+        return probas.reshape(len(feature_matrix), -1)
+    
     def generate_training_data(self, n_samples=1000):
         """Generate synthetic training data for demo purposes"""
-        np.random.seed(42)
-        
-        # Generate fake and real account features
-        fake_data = []
-        real_data = []
-        
-        for i in range(n_samples // 2):
-            # Fake account characteristics
-            fake_features = {
-                'followers_count': np.random.exponential(100),
-                'following_count': np.random.exponential(500),
-                'posts_count': np.random.poisson(5),
-                'account_age_days': np.random.exponential(30),
-                'profile_pic': np.random.choice([0, 1], p=[0.3, 0.7]),
-                'bio_length': np.random.exponential(20),
-                'verified': 0,
-                'username_digits': np.random.poisson(4),
-                'engagement_rate': np.random.exponential(0.01),
-                'posting_frequency': np.random.exponential(0.5)
-            }
-            fake_data.append(list(fake_features.values()) + [1])  # 1 = fake
-            
-            # Real account characteristics
-            real_features = {
-                'followers_count': np.random.exponential(500),
-                'following_count': np.random.exponential(200),
-                'posts_count': np.random.poisson(50),
-                'account_age_days': np.random.exponential(365),
-                'profile_pic': np.random.choice([0, 1], p=[0.1, 0.9]),
-                'bio_length': np.random.normal(80, 30),
-                'verified': np.random.choice([0, 1], p=[0.95, 0.05]),
-                'username_digits': np.random.poisson(1),
-                'engagement_rate': np.random.normal(0.03, 0.01),
-                'posting_frequency': np.random.exponential(2)
-            }
-            real_data.append(list(real_features.values()) + [0])  # 0 = real
+        rng = np.random.default_rng(42)
+        n = n_samples // 2
+        
+        # Fake account characteristics
+        fake_data = pd.DataFrame({
+            'followers_count': rng.exponential(100, n),
+            'following_count': rng.exponential(500, n),
+            'posts_count': rng.poisson(5, n),
+            'account_age_days': rng.exponential(30, n),
+            'profile_pic': rng.choice([0, 1], size=n, p=[0.3, 0.7]),
+            'bio_length': rng.exponential(20, n),
+            'verified': np.zeros(n, dtype=int),
+            'username_digits': rng.poisson(4, n),
+            'engagement_rate': rng.exponential(0.01, n),
+            'posting_frequency': rng.exponential(0.5, n),
+            'is_fake': np.ones(n, dtype=int)  # 1 = fake
+        })
         
-        # Combine and create DataFrame
-        all_data = fake_data + real_data
-        columns = ['followers_count', 'following_count', 'posts_count', 'account_age_days',
-                  'profile_pic', 'bio_length', 'verified', 'username_digits',
-                  'engagement_rate', 'posting_frequency', 'is_fake']
+        # Real account characteristics
+        real_data = pd.DataFrame({
+            'followers_count': rng.exponential(500, n),
+            'following_count': rng.exponential(200, n),
+            'posts_count': rng.poisson(50, n),
+            'account_age_days': rng.exponential(365, n),
+            'profile_pic': rng.choice([0, 1], size=n, p=[0.1, 0.9]),
+            'bio_length': rng.normal(80, 30, n),
+            'verified': rng.choice([0, 1], size=n, p=[0.95, 0.05]),
+            'username_digits': rng.poisson(1, n),
+            'engagement_rate': rng.normal(0.03, 0.01, n),
+            'posting_frequency': rng.exponential(2, n),
+            'is_fake': np.zeros(n, dtype=int)  # 0 = real
+        })
         
-        return pd.DataFrame(all_data, columns=columns)
+        # Combine column-wise samples instead of building rows one at a time
+        return pd.concat([fake_data, real_data], ignore_index=True)
     
     def train_models(self):
         """Train ML models with synthetic data"""
@@ -237,20 +335,22 @@ class MLFakeAccountDetector:
         # Generate training data
         df = self.generate_training_data(2000)
         
-        # Prepare features and target
-        X = df.drop('is_fake', axis=1)
-        y = df['is_fake']
+        # Prepare features and target as plain arrays; the pipeline is fitted on
+        # the same array layout it receives at prediction time
+        X = df.loc[:, FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+        y = df['is_fake'].to_numpy()
         
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        # Scale features and train classifier
+        self.profile_pipeline.fit(X, y)
         
-        # Train classifier
-        self.profile_classifier.fit(X_scaled, y)
+        # Fit across all cores, but predict single requests without the
+        # thread pool overhead (and without oversubscribing server workers)
+        self.profile_pipeline.set_params(classifier__n_jobs=1)
         
         # Save models
-        joblib.dump(self.profile_classifier, 'profile_classifier.pkl')
-        joblib.dump(self.scaler, 'feature_scaler.pkl')
+        joblib.dump(self.profile_pipeline, 'fake_account_model.pkl', compress=3)
         
+        self.compile_forest()
         self.is_trained = True
         logger.info("ML models trained successfully")
     
@@ -260,61 +360,85 @@ class MLFakeAccountDetector:
         bio = account_data.get('bio', '')
         platform = account_data.get('platform', '')
         
-        # Extract numerical features
+        # Extract numerical features; metrics the client does not supply fall
+        # back to fixed typical values so repeated analyses are deterministic
         features = {
-            'followers_count': np.random.exponential(300),  # Simulated - in real app, fetch from API
-            'following_count': np.random.exponential(250),
-            'posts_count': np.random.poisson(20),
-            'account_age_days': np.random.exponential(200),
+            'followers_count': float(account_data.get('followersCount', 300)),  # In real app, fetch from API
+            'following_count': float(account_data.get('followingCount', 250)),
+            'posts_count': int(account_data.get('postsCount', 20)),
+            'account_age_days': float(account_data.get('accountAgeDays', 200)),
             'profile_pic': 1 if account_data.get('profilePicture') else 0,
             'bio_length': len(bio),
-            'verified': 0,  # Simulated
-            'username_digits': len(re.findall(r'\d', username)),
-            'engagement_rate': np.random.exponential(0.02),
-            'posting_frequency': np.random.exponential(1.5)
+            'verified': 1 if account_data.get('verified') else 0,
+            'username_digits': sum(map(str.isdecimal, username)),
+            'engagement_rate': float(account_data.get('engagementRate', 0.02)),
+            'posting_frequency': float(account_data.get('postingFrequency', 1.5))
         }
         
         return features
     
     def analyze_account(self, account_data):
         """Analyze account and predict if it's fake"""
+        return self.analyze_accounts([account_data])[0]
+    
+    def analyze_accounts(self, accounts):
+        """Analyze a batch of accounts with a single model call"""
         if not self.is_trained:
             self.train_models()
         
+        # Extract features per account so one malformed account only fails itself
+        analyses = [None] * len(accounts)
+        rows = []
+        features_list = []
+        for index, account in enumerate(accounts):
+            try:
+                features_list.append(self.extract_features_from_account(account))
+                rows.append(index)
+            except Exception as e:
+                logger.error(f"Feature extraction failed for account {index}: {e}")
+                analyses[index] = self.get_fallback_analysis()
+        
+        if not rows:
+            return analyses
+        
         try:
-            # Extract features
-            features = self.extract_features_from_account(account_data)
-            feature_vector = np.array(list(features.values())).reshape(1, -1)
-            
-            # Scale features
-            feature_vector_scaled = self.scaler.transform(feature_vector)
+            feature_matrix = np.empty((len(features_list), len(FEATURE_COLUMNS)), dtype=np.float64)
+            for row, features in enumerate(features_list):
+                feature_matrix[row] = get_feature_values(features)
             
-            # Predict
-            fake_probability = self.profile_classifier.predict_proba(feature_vector_scaled)[0][1]
-            prediction = self.profile_classifier.predict(feature_vector_scaled)[0]
+            # Scale and predict once, deriving the classes from the probabilities
+            probas = self.predict_probabilities(feature_matrix)
+            predictions = self.profile_pipeline.classes_[probas.argmax(axis=1)]
             
-            # Generate analysis report
-            analysis = {
-                'fake_probability': float(fake_probability),
-                'is_fake': bool(prediction),
-                'risk_level': self.get_risk_level(fake_probability),
-                'confidence': float(np.max(self.profile_classifier.predict_proba(feature_vector_scaled))),
-                'features': features,
-                'detection_reasons': self.get_detection_reasons(features, fake_probability)
-            }
-            
-            return analysis
+            # Generate analysis reports
+            for index, features, proba, prediction in zip(rows, features_list, probas, predictions):
+                fake_probability = proba[1]
+                analyses[index] = {
+                    'fake_probability': float(fake_probability),
+                    'is_fake': bool(prediction),
+                    'risk_level': self.get_risk_level(fake_probability),
+                    'confidence': float(proba.max()),
+                    'features': features,
+                    'detection_reasons': self.get_detection_reasons(features, fake_probability)
+                }
             
         except Exception as e:
             logger.error(f"Account analysis failed: {e}")
-            return {
-                'fake_probability': 0.5,
-                'is_fake': False,
-                'risk_level': 'unknown',
-                'confidence': 0.5,
-                'features': {},
-                'detection_reasons': ['Analysis failed']
-            }
+            for index in rows:
+                analyses[index] = self.get_fallback_analysis()
+        
+        return analyses
+    
+    def get_fallback_analysis(self):
+        """Neutral result for an account that could not be analyzed"""
+        return {
+            'fake_probability': 0.5,
+            'is_fake': False,
+            'risk_level': 'unknown',
+            'confidence': 0.5,
+            'features': {},
+            'detection_reasons': ['Analysis failed']
+        }
     
     def get_risk_level(self, probability):
         """Convert probability to risk level"""
@@ -349,6 +473,55 @@ class MLFakeAccountDetector:
         
         return reasons if reasons else ['Account appears normal']
 
+# Maximum number of accounts accepted by /api/analyze/batch
+MAX_BATCH_SIZE = 100
+
+# Optional client-supplied account metrics, which must be numbers when present
+NUMERIC_ACCOUNT_FIELDS = (
+    'followersCount', 'followingCount', 'postsCount', 'accountAgeDays',
+    'engagementRate', 'postingFrequency'
+)
+
+# Largest accepted metric magnitude; integers up to 2**53 stay exact as floats
+# and still serialize as 64-bit JSON numbers when echoed back
+MAX_ACCOUNT_METRIC = 2 ** 53
+
+# Fallback contact for agency report notifications
+DEFAULT_AGENCY_EMAIL = 'itbp.cybersecurity@gov.in'
+
+# The config file is parsed once and re-read only when it changes
+CONFIG_PATH = 'config.json'
+CONFIG_CACHE_TTL = 30  # seconds
+_config_cache = {'data': None, 'mtime': None, 'checked': 0.0}
+_config_cache_lock = threading.Lock()
+
+# System statistics are served from a short-lived cache
+STATS_CACHE_TTL = 5  # seconds
+_stats_cache = {'data': None, 'expires': 0.0}
+_stats_cache_lock = threading.Lock()
+
+# Local blockchain records are buffered and written in batches
+RECORD_FLUSH_INTERVAL = 0.2  # seconds
+RECORD_FLUSH_BATCH_SIZE = 500
+WAL_CHECKPOINT_INTERVAL = 60  # seconds
+_pending_records = Queue(maxsize=10000)
+_record_writer = None
+_record_writer_lock = threading.Lock()
+_record_writer_stop = threading.Event()
+
+INSERT_TRANSACTION_SQL = '''
+    INSERT INTO blockchain_transactions (function_name, args, tx_hash)
+    VALUES (?, ?, ?)
+'''
+INSERT_REPORT_SQL = '''
+    INSERT INTO fake_account_reports 
+    (platform, username, risk_score, evidence, tx_hash, report_id, agency, priority, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Background worker for blockchain recording and report notifications
+background_executor = ThreadPoolExecutor(max_workers=8)
+
 # Initialize components
 blockchain_manager = StacksBlockchainManager()
 ml_detector = MLFakeAccountDetector()
@@ -371,29 +544,19 @@ def analyze_account():
         data = request.json
         
         # Validate input
-        required_fields = ['platform', 'username']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        error = validate_account(data)
+        if error:
+            return jsonify({'error': error}), 400
         
         # Perform ML analysis
         analysis = ml_detector.analyze_account(data)
         
         # Record to blockchain if high risk
-        blockchain_result = None
-        if analysis['fake_probability'] >= 0.4:
-            report_id = f"RPT_{int(datetime.now().timestamp())}"
-            blockchain_result = blockchain_manager.report_fake_account(
-                platform=data['platform'],
-                username=data['username'],
-                risk_score=analysis['fake_probability'],
-                evidence=f"ML Analysis: {', '.join(analysis['detection_reasons'])}",
-                report_id=report_id,
-                sender_key=blockchain_manager.private_key
-            )
+        report_id = f"RPT_{int(datetime.now().timestamp())}"
+        blockchain_result = queue_blockchain_recording(data, analysis, report_id)
         
         # Update statistics
-        update_statistics(analysis)
+        update_statistics([analysis])
         
         return jsonify({
             'success': True,
@@ -406,6 +569,54 @@ def analyze_account():
         logger.error(f"Analysis failed: {e}")
         return jsonify({'error': 'Analysis failed', 'details': str(e)}), 500
 
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_accounts_batch():
+    """Analyze multiple accounts in a single model pass"""
+    try:
+        data = request.json
+        accounts = data.get('accounts') if isinstance(data, dict) else None
+        
+        # Validate input
+        if not accounts or not isinstance(accounts, list):
+            return jsonify({'error': 'Missing required field: accounts'}), 400
+        
+        if len(accounts) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'Batch size exceeds limit of {MAX_BATCH_SIZE}'}), 400
+        
+        for index, account in enumerate(accounts):
+            error = validate_account(account)
+            if error:
+                return jsonify({'error': f'{error} (account {index})'}), 400
+        
+        # Perform ML analysis
+        analyses = ml_detector.analyze_accounts(accounts)
+        
+        # Record high risk accounts to blockchain
+        batch_timestamp = int(datetime.now().timestamp())
+        results = []
+        for index, (account, analysis) in enumerate(zip(accounts, analyses)):
+            report_id = f"RPT_{batch_timestamp}_{index}"
+            blockchain_result = queue_blockchain_recording(account, analysis, report_id)
+            results.append({
+                'platform': account['platform'],
+                'username': account['username'],
+                'analysis': analysis,
+                'blockchain': blockchain_result
+            })
+        
+        # Update statistics
+        update_statistics(analyses)
+        
+        return jsonify({
+            'success': True,
+            'results': results,
+            'timestamp': datetime.now().isoformat()
+        })
+        
+    except Exception as e:
+        logger.error(f"Batch analysis failed: {e}")
+        return jsonify({'error': 'Batch analysis failed', 'details': str(e)}), 500
+
 @app.route('/api/report', methods=['POST'])
 def generate_report():
     """Generate official report for agencies"""
@@ -434,8 +645,8 @@ def generate_report():
         # Store report in database
         store_report(report_data)
         
-        # Send email notification (simulated)
-        send_report_notification(report_data)
+        # Send email notification (simulated) without blocking the response
+        background_executor.submit(send_report_notification, report_data).add_done_callback(log_background_failure)
         
         return jsonify({
             'success': True,
@@ -452,34 +663,9 @@ def generate_report():
 def get_statistics():
     """Get system statistics"""
     try:
-        conn = sqlite3.connect('blockchain_records.db')
-        cursor = conn.cursor()
-        
-        # Get basic stats
-        cursor.execute('SELECT * FROM system_stats WHERE id = 1')
-        stats = cursor.fetchone()
-        
-        # Get blockchain stats
-        cursor.execute('SELECT COUNT(*) FROM blockchain_transactions')
-        blockchain_records = cursor.fetchone()[0]
-        
-        # Get recent reports
-        cursor.execute('''
-            SELECT COUNT(*) FROM fake_account_reports 
-            WHERE timestamp > datetime('now', '-7 days')
-        ''')
-        recent_reports = cursor.fetchone()[0]
-        
-        conn.close()
-        
-        return jsonify({
-            'total_analyzed': stats[1] if stats else 0,
-            'fake_detected': stats[2] if stats else 0,
-            'reports_sent': stats[3] if stats else 0,
-            'blockchain_records': blockchain_records,
-            'recent_reports': recent_reports,
-            'last_updated': stats[4] if stats else datetime.now().isoformat()
-        })
+        response = jsonify(get_cached_statistics())
+        response.headers['Cache-Control'] = f'public, max-age={STATS_CACHE_TTL}'
+        return response
         
     except Exception as e:
         logger.error(f"Statistics retrieval failed: {e}")
@@ -489,7 +675,7 @@ def get_statistics():
 def get_blockchain_records():
     """Get recent blockchain records"""
     try:
-        conn = sqlite3.connect('blockchain_records.db')
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -499,16 +685,7 @@ def get_blockchain_records():
             LIMIT 10
         ''')
         
-        records = []
-        for row in cursor.fetchall():
-            records.append({
-                'tx_hash': row[0],
-                'function_name': row[1],
-                'timestamp': row[2],
-                'status': row[3]
-            })
-        
-        conn.close()
+        records = [dict(row) for row in cursor.fetchall()]
         
         return jsonify({
             'success': True,
@@ -520,66 +697,268 @@ def get_blockchain_records():
         return jsonify({'error': 'Records retrieval failed'}), 500
 
 # Helper functions
-def update_statistics(analysis):
-    """Update system statistics"""
+def validate_account(account):
+    """Return an error message if account data cannot be analyzed, else None"""
+    if not isinstance(account, dict):
+        return 'Account data must be a JSON object'
+    
+    required_fields = ['platform', 'username']
+    for field in required_fields:
+        if not account.get(field):
+            return f'Missing required field: {field}'
+        if not isinstance(account[field], str):
+            return f'Invalid field type: {field} must be a string'
+    
+    if not isinstance(account.get('bio', ''), str):
+        return 'Invalid field type: bio must be a string'
+    
+    # bool is an int subclass, but true/false are not valid metrics
+    for field in NUMERIC_ACCOUNT_FIELDS:
+        if field in account:
+            value = account[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                return f'Invalid field type: {field} must be a number'
+            if abs(value) > MAX_ACCOUNT_METRIC:
+                return f'Invalid field value: {field} is out of range'
+    
+    return None
+
+def log_background_failure(future):
+    """Log an exception raised by a background task"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background task failed: {future.exception()}")
+
+def enqueue_local_record(transaction_row, report_row=None):
+    """Queue a blockchain record, starting the batch writer thread on first use"""
+    global _record_writer
+    
+    # Started lazily so preloaded Gunicorn workers each get their own writer
+    with _record_writer_lock:
+        if _record_writer is None or not _record_writer.is_alive():
+            _record_writer = threading.Thread(target=run_record_writer, name='record-writer', daemon=True)
+            _record_writer.start()
+    
+    _pending_records.put((transaction_row, report_row))
+
+def drain_pending_records(limit):
+    """Take up to limit queued records without blocking"""
+    records = []
+    while len(records) < limit:
+        try:
+            records.append(_pending_records.get_nowait())
+        except Empty:
+            break
+    return records
+
+def write_local_records(records):
+    """Write queued records in a single transaction, one commit per batch"""
+    conn = get_db_connection()
+    transaction_rows = [transaction_row for transaction_row, _ in records]
+    report_rows = [report_row for _, report_row in records if report_row is not None]
+    
     try:
-        conn = sqlite3.connect('blockchain_records.db')
-        cursor = conn.cursor()
+        with conn:
+            conn.executemany(INSERT_TRANSACTION_SQL, transaction_rows)
+            conn.executemany(INSERT_REPORT_SQL, report_rows)
+    except sqlite3.Error as e:
+        # One bad row (e.g. a duplicate report_id) must not drop the whole batch
+        logger.warning(f"Batch record write failed, retrying individually: {e}")
+        for transaction_row, report_row in records:
+            try:
+                with conn:
+                    conn.execute(INSERT_TRANSACTION_SQL, transaction_row)
+                    if report_row is not None:
+                        conn.execute(INSERT_REPORT_SQL, report_row)
+            except sqlite3.Error as e:
+                logger.error(f"Local record write failed for {transaction_row[2]}: {e}")
+
+def write_pending_records():
+    """Drain the queue in batches of RECORD_FLUSH_BATCH_SIZE"""
+    while True:
+        records = drain_pending_records(RECORD_FLUSH_BATCH_SIZE)
+        if not records:
+            break
+        write_local_records(records)
+
+def run_record_writer():
+    """Flush queued records every RECORD_FLUSH_INTERVAL and checkpoint the WAL periodically"""
+    last_checkpoint = time.monotonic()
+    
+    # Records stay on the queue between flushes, so nothing is held while waiting
+    while not _record_writer_stop.wait(RECORD_FLUSH_INTERVAL):
+        write_pending_records()
         
-        cursor.execute('''
-            UPDATE system_stats 
-            SET total_analyzed = total_analyzed + 1,
-                fake_detected = fake_detected + ?,
-                last_updated = CURRENT_TIMESTAMP
-            WHERE id = 1
-        ''', (1 if analysis['is_fake'] else 0,))
-        
-        conn.commit()
-        conn.close()
+        if time.monotonic() - last_checkpoint >= WAL_CHECKPOINT_INTERVAL:
+            try:
+                get_db_connection().execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+            last_checkpoint = time.monotonic()
+
+@atexit.register
+def flush_pending_records():
+    """Stop the writer, letting any in-progress batch finish, then write what is left"""
+    _record_writer_stop.set()
+    if _record_writer is not None:
+        _record_writer.join()
+    write_pending_records()
+
+def fetch_statistics():
+    """Read system statistics from the database"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    # Get basic, blockchain and recent report stats in a single query
+    cursor.execute('''
+        SELECT s.total_analyzed, s.fake_detected, s.reports_sent, s.last_updated,
+               (SELECT COUNT(*) FROM blockchain_transactions),
+               (SELECT COUNT(*) FROM fake_account_reports
+                WHERE timestamp > datetime('now', '-7 days'))
+        FROM (SELECT 1) LEFT JOIN system_stats s ON s.id = 1
+    ''')
+    (total_analyzed, fake_detected, reports_sent, last_updated,
+     blockchain_records, recent_reports) = cursor.fetchone()
+    
+    return {
+        'total_analyzed': total_analyzed or 0,
+        'fake_detected': fake_detected or 0,
+        'reports_sent': reports_sent or 0,
+        'blockchain_records': blockchain_records,
+        'recent_reports': recent_reports,
+        'last_updated': last_updated or datetime.now().isoformat()
+    }
+
+def get_cached_statistics():
+    """Get system statistics, querying the database at most once per TTL"""
+    with _stats_cache_lock:
+        now = time.monotonic()
+        if _stats_cache['data'] is None or now >= _stats_cache['expires']:
+            _stats_cache['data'] = fetch_statistics()
+            _stats_cache['expires'] = now + STATS_CACHE_TTL
+        return _stats_cache['data']
+
+def record_analysis_to_blockchain(account_data, analysis, report_id):
+    """Record an analysis to the blockchain if it is medium or high risk"""
+    if analysis['fake_probability'] < 0.4:
+        return None
+    
+    return blockchain_manager.report_fake_account(
+        platform=account_data['platform'],
+        username=account_data['username'],
+        risk_score=analysis['fake_probability'],
+        evidence=f"ML Analysis: {', '.join(analysis['detection_reasons'])}",
+        report_id=report_id,
+        sender_key=blockchain_manager.private_key
+    )
+
+def queue_blockchain_recording(account_data, analysis, report_id):
+    """Queue blockchain recording in the background for medium or high risk analyses"""
+    # Fallback results carry no real score and are never reported
+    if analysis['risk_level'] == 'unknown' or analysis['fake_probability'] < 0.4:
+        return None
+    
+    background_executor.submit(
+        record_analysis_to_blockchain, account_data, analysis, report_id
+    ).add_done_callback(log_background_failure)
+    return {'status': 'queued', 'report_id': report_id}
+
+def update_statistics(analyses):
+    """Update system statistics for a list of analyses with a single UPDATE"""
+    try:
+        fake_detected = sum(1 for analysis in analyses if analysis['is_fake'])
+        conn = get_db_connection()
+        with conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE system_stats 
+                SET total_analyzed = total_analyzed + ?,
+                    fake_detected = fake_detected + ?,
+                    last_updated = CURRENT_TIMESTAMP
+                WHERE id = 1
+            ''', (len(analyses), fake_detected))
     except Exception as e:
         logger.error(f"Statistics update failed: {e}")
 
 def store_report(report_data):
     """Store report in database"""
     try:
-        conn = sqlite3.connect('blockchain_records.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO fake_account_reports 
-            (report_id, agency, priority, evidence, status)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            report_data['report_id'],
-            report_data['agency'],
-            report_data['priority'],
-            report_data['evidence'],
-            report_data['status']
-        ))
-        
-        # Update stats
-        cursor.execute('''
-            UPDATE system_stats 
-            SET reports_sent = reports_sent + 1,
-                last_updated = CURRENT_TIMESTAMP
-            WHERE id = 1
-        ''')
-        
-        conn.commit()
-        conn.close()
+        conn = get_db_connection()
+        with conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO fake_account_reports 
+                (report_id, agency, priority, evidence, status)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                report_data['report_id'],
+                report_data['agency'],
+                report_data['priority'],
+                report_data['evidence'],
+                report_data['status']
+            ))
+            
+            # Update stats
+            cursor.execute('''
+                UPDATE system_stats 
+                SET reports_sent = reports_sent + 1,
+                    last_updated = CURRENT_TIMESTAMP
+                WHERE id = 1
+            ''')
     except Exception as e:
         logger.error(f"Report storage failed: {e}")
 
+def load_config():
+    """Read the config file, or an empty config if it is unavailable"""
+    try:
+        with open(CONFIG_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Config unavailable, using defaults: {e}")
+        return {}
+
+def get_config():
+    """Get the parsed config, re-reading the file only after the TTL if it has changed"""
+    with _config_cache_lock:
+        now = time.monotonic()
+        if _config_cache['data'] is not None and now < _config_cache['checked'] + CONFIG_CACHE_TTL:
+            return _config_cache['data']
+        
+        try:
+            mtime = os.path.getmtime(CONFIG_PATH)
+        except OSError:
+            mtime = None
+        
+        if _config_cache['data'] is None or mtime != _config_cache['mtime']:
+            _config_cache['data'] = load_config()
+            _config_cache['mtime'] = mtime
+        _config_cache['checked'] = now
+        return _config_cache['data']
+
+def get_agency_email(agency):
+    """Get the notification address for an agency"""
+    agency_config = get_config().get('agencies', {}).get(agency, {})
+    return agency_config.get('email', DEFAULT_AGENCY_EMAIL)
+
 def send_report_notification(report_data):
     """Send email notification to agency"""
-    # In production, implement actual email sending
-    logger.info(f"Report notification sent: {report_data['report_id']} to {report_data['agency']}")
+    recipient = get_agency_email(report_data['agency'])
+    
+    # In production, implement actual email sending. Evidence is user-supplied
+    # and is deliberately kept out of the logs.
+    logger.info(f"Report notification sent: {report_data['report_id']} "
+                f"({report_data['priority']} priority) to {recipient}")
 
 def init_database():
     """Initialize database with required tables"""
-    conn = sqlite3.connect('blockchain_records.db')
+    # Use a dedicated connection so no handle is shared with forked workers
+    conn = sqlite3.connect(DATABASE_PATH)
     cursor = conn.cursor()
     
+    # WAL journaling is persistent, so it only needs to be enabled once
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
     # Create tables if they don't exist
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS fake_account_reports (
@@ -618,6 +997,17 @@ def init_database():
         )
     ''')
     
+    # Index the timestamp columns used for recency filters and ordering
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_reports_timestamp
+        ON fake_account_reports(timestamp DESC)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_transactions_timestamp
+        ON blockchain_transactions(timestamp DESC)
+    ''')
+    
     # Insert initial stats if not exists
     cursor.execute('''
         INSERT OR IGNORE INTO system_stats (id, total_analyzed, fake_detected, reports_sent)
@@ -631,8 +1021,9 @@ if __name__ == '__main__':
     # Initialize database
     init_database()
     
-    # Train ML models
-    ml_detector.train_models()
+    # Train ML models only when no cached models were loaded
+    if not ml_detector.is_trained:
+        ml_detector.train_models()
     
     # Start Flask app
     port = int(os.environ.get('PORT', 5000))
@@ -7,21 +7,22 @@ This script creates the complete project structure and deploys everything
 import os
 import sys
 import json
-import subprocess
 import sqlite3
 import shutil
+import platform
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
 
-class ITBPSystemDeployment:
-    def __init__(self):
-        self.project_name = "itbp-fake-account-system"
-        self.base_dir = Path.cwd() / self.project_name
-        self.success_count = 0
-        self.total_steps = 10
-        
-    def print_header(self):
-        header = """
+try:
+    import orjson
+except ImportError:  # Optional: faster config serialization, the json module is used otherwise
+    orjson = None
+
+HEADER_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    ITBP FAKE ACCOUNT DETECTION SYSTEM                        ║
 ║                         ONE-CLICK DEPLOYMENT                                ║
@@ -31,44 +32,9 @@ class ITBPSystemDeployment:
 ║  📊 Real-time Analytics and Reporting                                       ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
         """
-        print(header)
-        print(f"Deployment Target: {self.base_dir}")
-        print("-" * 80)
-    
-    def step(self, message):
-        """Print step progress"""
-        self.success_count += 1
-        print(f"[{self.success_count}/{self.total_steps}] {message}")
-    
-    def create_project_structure(self):
-        """Create complete project directory structure"""
-        self.step("Creating project structure...")
-        
-        directories = [
-            "frontend",
-            "backend", 
-            "smart-contract",
-            "config",
-            "scripts",
-            "tests",
-            "database",
-            "docs",
-            "logs"
-        ]
-        
-        self.base_dir.mkdir(exist_ok=True)
-        
-        for dir_name in directories:
-            (self.base_dir / dir_name).mkdir(exist_ok=True)
-        
-        print(f"   ✅ Created project structure in {self.base_dir}")
-    
-    def create_frontend_files(self):
-        """Create frontend HTML file"""
-        self.step("Creating frontend files...")
-        
-        # The frontend file content from the artifact above
-        frontend_content = '''<!DOCTYPE html>
+
+# Placeholder frontend page
+FRONTEND_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -93,17 +59,9 @@ class ITBPSystemDeployment:
     <div>Loading ITBP System...</div>
 </body>
 </html>'''
-        
-        frontend_path = self.base_dir / "frontend" / "index.html"
-        frontend_path.write_text(frontend_content)
-        print("   ✅ Created frontend/index.html (placeholder)")
-    
-    def create_backend_files(self):
-        """Create backend Python files"""
-        self.step("Creating backend files...")
-        
-        # Simplified backend for deployment
-        backend_content = '''#!/usr/bin/env python3
+
+# Simplified backend for deployment
+BACKEND_SERVER_SOURCE = '''#!/usr/bin/env python3
 """
 ITBP Fake Account Detection System - Backend API
 Simplified version for deployment - see integration guide for complete version
@@ -163,17 +121,9 @@ if __name__ == '__main__':
     print("Complete backend implementation available in integration guide")
     app.run(host='0.0.0.0', port=5000, debug=True)
 '''
-        
-        backend_path = self.base_dir / "backend" / "backend_server.py"
-        backend_path.write_text(backend_content)
-        print("   ✅ Created backend/backend_server.py")
-    
-    def create_smart_contract(self):
-        """Create Clarity smart contract"""
-        self.step("Creating smart contract...")
-        
-        # Copy the Clarity contract from the document
-        contract_content = ''';; ITBP Fake Account Registry - Clarity Smart Contract
+
+# Clarity contract from the document
+SMART_CONTRACT_SOURCE = ''';; ITBP Fake Account Registry - Clarity Smart Contract
 ;; Smart contract for recording fake social media accounts on Stacks blockchain
 
 ;; Constants
@@ -238,17 +188,9 @@ if __name__ == '__main__':
 (define-read-only (get-report (report-id (string-ascii 64)))
   (map-get? fake-account-reports { report-id: report-id }))
 '''
-        
-        contract_path = self.base_dir / "smart-contract" / "fake-account-registry.clar"
-        contract_path.write_text(contract_content)
-        print("   ✅ Created smart-contract/fake-account-registry.clar")
-    
-    def create_configuration_files(self):
-        """Create configuration files"""
-        self.step("Creating configuration files...")
-        
-        # Environment configuration
-        env_content = '''# ITBP Fake Account Detection System Configuration
+
+# Environment configuration
+ENV_CONFIG = '''# ITBP Fake Account Detection System Configuration
 FLASK_ENV=development
 FLASK_DEBUG=True
 SECRET_KEY=itbp_secure_key_2024
@@ -269,83 +211,24 @@ SMTP_PORT=587
 EMAIL_USER=your_email@gmail.com
 EMAIL_PASSWORD=your_app_password
 '''
-        
-        env_path = self.base_dir / "config" / ".env"
-        env_path.write_text(env_content)
-        
-        # API Configuration
-        config_content = {
-            "agencies": {
-                "itbp": {
-                    "name": "Indo-Tibetan Border Police",
-                    "email": "itbp.cybersecurity@gov.in",
-                    "priority_threshold": 0.6
-                }
-            },
-            "stacks": {
-                "network": "testnet",
-                "api_url": "https://api.testnet.hiro.so"
-            }
+
+# API configuration written to config/config.json
+API_CONFIG = {
+    "agencies": {
+        "itbp": {
+            "name": "Indo-Tibetan Border Police",
+            "email": "itbp.cybersecurity@gov.in",
+            "priority_threshold": 0.6
         }
-        
-        config_path = self.base_dir / "config" / "config.json"
-        config_path.write_text(json.dumps(config_content, indent=2))
-        
-        print("   ✅ Created configuration files")
-    
-    def create_database(self):
-        """Initialize SQLite database"""
-        self.step("Creating database...")
-        
-        db_path = self.base_dir / "database" / "blockchain_records.db"
-        
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        # Create main tables
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS fake_account_reports (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL,
-                username TEXT NOT NULL,
-                risk_score REAL NOT NULL,
-                evidence TEXT,
-                tx_hash TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                report_id TEXT UNIQUE,
-                agency TEXT,
-                priority TEXT,
-                status TEXT DEFAULT 'pending'
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_stats (
-                id INTEGER PRIMARY KEY,
-                total_analyzed INTEGER DEFAULT 0,
-                fake_detected INTEGER DEFAULT 0,
-                reports_sent INTEGER DEFAULT 0,
-                blockchain_records INTEGER DEFAULT 0,
-                last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Insert initial stats
-        cursor.execute('''
-            INSERT OR IGNORE INTO system_stats (id, total_analyzed, fake_detected, reports_sent)
-            VALUES (1, 0, 0, 0)
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-        print(f"   ✅ Created database: {db_path}")
-    
-    def create_requirements(self):
-        """Create requirements.txt"""
-        self.step("Creating requirements file...")
-        
-        requirements = '''flask==2.3.3
+    },
+    "stacks": {
+        "network": "testnet",
+        "api_url": "https://api.testnet.hiro.so"
+    }
+}
+
+# Pinned Python dependencies
+REQUIREMENTS = '''flask==2.3.3
 flask-cors==4.0.0
 pandas==2.1.0
 numpy==1.24.3
@@ -356,18 +239,9 @@ python-dotenv==1.0.0
 gunicorn==21.2.0
 pytest==7.4.2
 '''
-        
-        req_path = self.base_dir / "requirements.txt"
-        req_path.write_text(requirements)
-        
-        print("   ✅ Created requirements.txt")
-    
-    def create_startup_scripts(self):
-        """Create startup scripts"""
-        self.step("Creating startup scripts...")
-        
-        # Windows batch file
-        windows_script = '''@echo off
+
+# Windows startup batch file
+WINDOWS_START_SCRIPT = '''@echo off
 echo ITBP Fake Account Detection System
 echo ==================================
 
@@ -387,12 +261,9 @@ start ../frontend/index.html
 
 pause
 '''
-        
-        windows_path = self.base_dir / "scripts" / "start_windows.bat"
-        windows_path.write_text(windows_script)
-        
-        # Unix shell script
-        unix_script = '''#!/bin/bash
+
+# Unix startup shell script
+UNIX_START_SCRIPT = '''#!/bin/bash
 echo "ITBP Fake Account Detection System"
 echo "=================================="
 
@@ -419,21 +290,9 @@ echo "Press Ctrl+C to stop system"
 trap 'kill $BACKEND_PID; exit' INT
 wait
 '''
-        
-        unix_path = self.base_dir / "scripts" / "start_unix.sh"
-        unix_path.write_text(unix_script)
-        
-        # Make Unix script executable
-        if os.name != 'nt':
-            os.chmod(unix_path, 0o755)
-        
-        print("   ✅ Created startup scripts")
-    
-    def create_documentation(self):
-        """Create documentation"""
-        self.step("Creating documentation...")
-        
-        readme_content = f'''# ITBP Fake Account Detection System
+
+# Project README, formatted with the project name and creation time
+README_TEMPLATE = '''# ITBP Fake Account Detection System
 
 ## Overview
 Advanced AI-powered social media security platform with Stacks blockchain integration.
@@ -452,7 +311,7 @@ Advanced AI-powered social media security platform with Stacks blockchain integr
 
 ### Manual Start
 ```bash
-# Install dependencies
+# Install dependencies (or, with a lock file: pip install --no-deps --require-hashes -r requirements.lock)
 pip install -r requirements.txt
 
 # Start backend
@@ -469,7 +328,7 @@ python backend_server.py
 
 ## Project Structure
 ```
-{self.project_name}/
+{project_name}/
 ├── frontend/           # Web interface
 ├── backend/           # Python API server
 ├── smart-contract/    # Clarity smart contract
@@ -479,6 +338,20 @@ python backend_server.py
 └── docs/            # Documentation
 ```
 
+## Dependency Lock
+`deploy.py --install` installs from `requirements.lock` when it exists, with `--no-deps --require-hashes`,
+so pip skips dependency resolution and verifies every download. Generate it from `requirements.txt` with
+`pip-compile --generate-hashes -o requirements.lock requirements.txt` (from pip-tools) and regenerate it
+whenever a pin changes.
+
+## Database
+`database/blockchain_records.db` is switched to WAL mode by the deployment script. WAL is stored in
+the database file, so every later connection keeps concurrent reads alongside the report writes;
+keep it enabled when opening the database from other tools. `synchronous=NORMAL`, an in-memory temp
+store and a 64 MB page cache are per-connection settings: the deployment script sets them on its own
+connection, the backend sets `synchronous=NORMAL` on each of its connections, and other tools get
+SQLite's defaults unless they set them too.
+
 ## Features
 - 🤖 AI-powered fake account detection
 - 🔗 Stacks blockchain integration
@@ -487,61 +360,17 @@ python backend_server.py
 - 🛡 Security monitoring
 
 ## Support
-Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Created: {created}
 For issues, refer to the complete integration guide.
 '''
-        
-        readme_path = self.base_dir / "README.md"
-        readme_path.write_text(readme_content)
-        
-        print("   ✅ Created README.md")
-    
-    def run_final_checks(self):
-        """Run final system checks"""
-        self.step("Running final system checks...")
-        
-        # Check Python installation
-        try:
-            result = subprocess.run([sys.executable, '--version'], 
-                                  capture_output=True, text=True)
-            python_version = result.stdout.strip()
-            print(f"   ✅ Python: {python_version}")
-        except:
-            print("   ⚠  Python check failed")
-        
-        # Check required directories
-        required_dirs = ['frontend', 'backend', 'smart-contract', 'database']
-        for dir_name in required_dirs:
-            dir_path = self.base_dir / dir_name
-            if dir_path.exists():
-                print(f"   ✅ Directory: {dir_name}/")
-            else:
-                print(f"   ❌ Missing: {dir_name}/")
-        
-        # Check key files
-        key_files = [
-            'frontend/index.html',
-            'backend/backend_server.py', 
-            'smart-contract/fake-account-registry.clar',
-            'requirements.txt',
-            'README.md'
-        ]
-        
-        for file_path in key_files:
-            full_path = self.base_dir / file_path
-            if full_path.exists():
-                print(f"   ✅ File: {file_path}")
-            else:
-                print(f"   ❌ Missing: {file_path}")
-    
-    def print_completion_message(self):
-        """Print final completion message"""
-        completion_msg = f'''
+
+# Final summary, formatted with the project location
+COMPLETION_TEMPLATE = '''
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                           DEPLOYMENT COMPLETED! 🎉                          ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
-📁 Project created at: {self.base_dir}
+📁 Project created at: {base_dir}
 
 🚀 Quick Start:
    Windows: Double-click scripts/start_windows.bat
@@ -553,7 +382,7 @@ For issues, refer to the complete integration guide.
    • Frontend: Open frontend/index.html in browser
 
 📋 Next Steps:
-   1. Navigate to project directory: cd {self.project_name}
+   1. Navigate to project directory: cd {project_name}
    2. Start the system using provided scripts
    3. Configure .env file with your Stacks credentials
    4. Deploy smart contract to Stacks testnet
@@ -578,6 +407,529 @@ For issues, refer to the complete integration guide.
    • Advanced monitoring and reporting
 
 Happy detecting! 🛡'''
+
+# Command line help, printed in one write
+USAGE_TEXT = """ITBP Fake Account Detection System Deployment
+Usage: python deploy.py [--install] [--verbose] [--force]
+This script creates the complete project structure and basic files.
+  --install   Install requirements.txt into the current Python environment
+  --verbose   Print each line as it happens instead of buffering output
+  --force     Overwrite generated files that already exist
+"""
+
+# Version stamped into the deployment database; bump it when the schema changes
+SCHEMA_VERSION = 2
+
+# Database schema, run as one script; it opens the transaction the seed data joins
+SCHEMA_SQL = '''
+BEGIN;
+
+-- Create main tables
+CREATE TABLE IF NOT EXISTS fake_account_reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform TEXT NOT NULL,
+    username TEXT NOT NULL,
+    risk_score REAL NOT NULL,
+    evidence TEXT,
+    tx_hash TEXT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    report_id TEXT UNIQUE,
+    agency TEXT,
+    priority TEXT,
+    status TEXT DEFAULT 'pending'
+);
+
+CREATE TABLE IF NOT EXISTS system_stats (
+    id INTEGER PRIMARY KEY,
+    total_analyzed INTEGER DEFAULT 0,
+    fake_detected INTEGER DEFAULT 0,
+    reports_sent INTEGER DEFAULT 0,
+    blockchain_records INTEGER DEFAULT 0,
+    last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Indexes for report lookups by account, status, routing agency and recency
+CREATE INDEX IF NOT EXISTS idx_reports_platform_user ON fake_account_reports(platform, username);
+CREATE INDEX IF NOT EXISTS idx_reports_status_ts ON fake_account_reports(status, timestamp);
+CREATE INDEX IF NOT EXISTS idx_reports_agency_priority ON fake_account_reports(agency, priority);
+CREATE INDEX IF NOT EXISTS idx_reports_timestamp ON fake_account_reports(timestamp DESC);
+'''
+
+# Installer (pip or uv) output lines streamed to the console while dependencies install
+PIP_PROGRESS_PREFIXES = (
+    "Collecting", "Downloading", "Installing", "Successfully",  # pip
+    "Resolved", "Prepared", "Installed"  # uv
+)
+
+# Installer errors meaning a pin has no wheel for this platform, so sdists must be allowed
+NO_WHEEL_MARKERS = ("No matching distribution", "building from source is disabled")
+
+@functools.lru_cache(maxsize=8)
+def render_completion_message(base_dir, project_name):
+    """Render the completion message once per project location"""
+    return COMPLETION_TEMPLATE.format(base_dir=base_dir, project_name=project_name)
+
+def dump_json(data):
+    """Serialize data as indented JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def apply_pragmas(conn):
+    """Apply the SQLite settings used for the system database"""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+
+def bulk_insert(conn, table, columns, rows, batch_size=1000, or_ignore=False):
+    """Insert rows with executemany in batches, inside a single transaction"""
+    verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+    placeholders = ", ".join("?" * len(columns))
+    sql = f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    
+    # Join the caller's transaction if one is open, otherwise commit once at the end
+    owns_transaction = not conn.in_transaction
+    if owns_transaction:
+        conn.execute("BEGIN")
+    
+    inserted = 0
+    try:
+        rows = iter(rows)
+        while batch := list(islice(rows, batch_size)):
+            conn.executemany(sql, batch)
+            inserted += len(batch)
+    except Exception:
+        if owns_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    
+    if owns_transaction:
+        conn.execute("COMMIT")
+    return inserted
+
+def initialize_schema(conn):
+    """Create the schema and seed data in one transaction and stamp the schema version"""
+    # The DDL script opens the transaction; the seed and version stamp then join it
+    try:
+        conn.executescript(SCHEMA_SQL)
+        
+        # Insert initial stats
+        bulk_insert(
+            conn, "system_stats",
+            ("id", "total_analyzed", "fake_detected", "reports_sent"),
+            [(1, 0, 0, 0)], or_ignore=True
+        )
+        
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+def find_missing_requirements(requirements):
+    """Return the requirements not already satisfied by an installed distribution"""
+    # Imported here so deployments without --install skip their import time
+    from importlib import metadata
+    try:
+        from packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:  # Optional: full specifier support, only exact == pins are checked otherwise
+        Requirement = None
+    
+    missing = []
+    for requirement in requirements:
+        if Requirement is not None:
+            try:
+                parsed = Requirement(requirement)
+            except InvalidRequirement:
+                missing.append(requirement)
+                continue
+            
+            # Requirements excluded by an environment marker never need installing
+            if parsed.marker is not None and not parsed.marker.evaluate():
+                continue
+            name, specifier = parsed.name, parsed.specifier
+        else:
+            name, _, pinned = requirement.partition('==')
+            specifier = None
+        
+        try:
+            installed = metadata.version(name.strip())
+        except metadata.PackageNotFoundError:
+            missing.append(requirement)
+            continue
+        
+        # Anything not provably satisfied is left for pip to decide
+        if specifier is not None:
+            satisfied = specifier.contains(installed, prereleases=True)
+        else:
+            satisfied = bool(pinned) and installed == pinned.strip()
+        if not satisfied:
+            missing.append(requirement)
+    return missing
+
+class ITBPSystemDeployment:
+    def __init__(self, install=False, verbose=False, force=False):
+        self.project_name = "itbp-fake-account-system"
+        # Resolved once, so every generated path is absolute and free of symlinks
+        self.base_dir = Path.cwd().resolve() / self.project_name
+        self.install = install
+        self.db_path = self.base_dir / "database" / "blockchain_records.db"
+        self.db_conn = None
+        self.verbose = verbose
+        self.force = force
+        self.output = []
+        self.success_count = 0
+        self.output_lock = threading.RLock()
+        self.total_steps = 11 if install else 10
+        
+    def print_header(self):
+        self.log(HEADER_BANNER)
+        self.log(f"Deployment Target: {self.base_dir}")
+        self.log("-" * 80)
+    
+    def log(self, message):
+        """Record a line of output, printing it immediately in verbose mode"""
+        with self.output_lock:
+            if self.verbose:
+                print(message)
+            else:
+                self.output.append(message)
+    
+    def flush_output(self):
+        """Write all buffered output in a single call"""
+        with self.output_lock:
+            if self.output:
+                sys.stdout.write("\n".join(self.output) + "\n")
+                sys.stdout.flush()
+                self.output.clear()
+    
+    def step(self, message):
+        """Print step progress"""
+        with self.output_lock:
+            self.success_count += 1
+            self.log(f"[{self.success_count}/{self.total_steps}] {message}")
+    
+    def write_files(self, files):
+        """Write generated files ({relative path: content or (content, mode)}) and return how many were written"""
+        written = 0
+        for relative_path, content in files.items():
+            mode = None
+            if isinstance(content, tuple):
+                content, mode = content
+            
+            # Encode explicitly so the emoji in generated files survive non-UTF-8 locales
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            path = self.base_dir / relative_path
+            
+            # Existing files may carry local edits, so only --force replaces them
+            if path.exists():
+                if not self.force:
+                    self.log(f"   ⏭  Kept existing {relative_path} (use --force to overwrite)")
+                    continue
+                if path.read_bytes() == content:
+                    self.log(f"   ✅ Unchanged {relative_path}")
+                    continue
+            
+            path.write_bytes(content)
+            written += 1
+            if mode is not None and os.name != 'nt':
+                os.chmod(path, mode)
+        return written
+    
+    def create_project_structure(self):
+        """Create complete project directory structure"""
+        self.step("Creating project structure...")
+        
+        directories = [
+            "frontend",
+            "backend", 
+            "smart-contract",
+            "config",
+            "scripts",
+            "tests",
+            "database",
+            "docs",
+            "logs"
+        ]
+        
+        self.base_dir.mkdir(exist_ok=True)
+        
+        for dir_name in directories:
+            (self.base_dir / dir_name).mkdir(exist_ok=True)
+        
+        self.log(f"   ✅ Created project structure in {self.base_dir}")
+    
+    def create_frontend_files(self):
+        """Create frontend HTML file"""
+        self.step("Creating frontend files...")
+        
+        if self.write_files({"frontend/index.html": FRONTEND_HTML}):
+            self.log("   ✅ Created frontend/index.html (placeholder)")
+    
+    def create_backend_files(self):
+        """Create backend Python files"""
+        self.step("Creating backend files...")
+        
+        if self.write_files({"backend/backend_server.py": BACKEND_SERVER_SOURCE}):
+            self.log("   ✅ Created backend/backend_server.py")
+    
+    def create_smart_contract(self):
+        """Create Clarity smart contract"""
+        self.step("Creating smart contract...")
+        
+        if self.write_files({"smart-contract/fake-account-registry.clar": SMART_CONTRACT_SOURCE}):
+            self.log("   ✅ Created smart-contract/fake-account-registry.clar")
+    
+    def create_configuration_files(self):
+        """Create configuration files"""
+        self.step("Creating configuration files...")
+        
+        if self.write_files({
+            "config/.env": ENV_CONFIG,
+            "config/config.json": dump_json(API_CONFIG)
+        }):
+            self.log("   ✅ Created configuration files")
+    
+    def get_db_connection(self):
+        """Get the deployment database connection, opening it once with the tuned PRAGMAs"""
+        if self.db_conn is None:
+            # Parameterized statements are compiled once and reused from this cache
+            self.db_conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
+            apply_pragmas(self.db_conn)
+        return self.db_conn
+    
+    def close_db_connection(self):
+        """Close the deployment database connection if it was opened"""
+        if self.db_conn is not None:
+            self.db_conn.close()
+            self.db_conn = None
+    
+    def create_database(self):
+        """Initialize SQLite database"""
+        self.step("Creating database...")
+        
+        # A new database is built in memory and written out in one sequential pass;
+        # the rename means a failed setup never leaves a half-initialized file behind
+        if not self.db_path.exists():
+            tmp_path = self.db_path.with_name(self.db_path.name + ".tmp")
+            tmp_path.unlink(missing_ok=True)
+            
+            conn = sqlite3.connect(":memory:", isolation_level=None)
+            try:
+                initialize_schema(conn)
+                conn.execute("VACUUM INTO ?", (str(tmp_path),))
+            finally:
+                conn.close()
+            os.replace(tmp_path, self.db_path)
+            
+            self.log(f"   ✅ Created database: {self.db_path}")
+            return
+        
+        conn = self.get_db_connection()
+        
+        # A database already at the current schema version needs no DDL or seeding
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            self.log(f"   ✅ Database already initialized (schema v{version}): {self.db_path}")
+            return
+        
+        initialize_schema(conn)
+        
+        self.log(f"   ✅ Upgraded database to schema v{SCHEMA_VERSION}: {self.db_path}")
+    
+    def bulk_insert_reports(self, rows):
+        """Insert report rows into the deployment database in one transaction"""
+        return bulk_insert(
+            self.get_db_connection(), "fake_account_reports",
+            ("platform", "username", "risk_score", "evidence", "tx_hash",
+             "report_id", "agency", "priority"),
+            rows, batch_size=10000, or_ignore=True
+        )
+    
+    def create_requirements(self):
+        """Create requirements.txt"""
+        self.step("Creating requirements file...")
+        
+        if self.write_files({"requirements.txt": REQUIREMENTS}):
+            self.log("   ✅ Created requirements.txt")
+    
+    def install_dependencies(self):
+        """Install all requirements with a single pip invocation"""
+        # Only --install needs these, so plain deployments skip their import time
+        import subprocess
+        import compileall
+        import sysconfig
+        
+        req_path = self.base_dir / "requirements.txt"
+        requirements = [
+            line.strip() for line in req_path.read_text().splitlines()
+            if line.strip() and not line.startswith('#')
+        ]
+        
+        # Standard library modules such as sqlite3 are not on PyPI and would fail the whole batch
+        stdlib = getattr(sys, 'stdlib_module_names', frozenset())
+        requirements = [
+            requirement for requirement in requirements
+            if requirement.partition('==')[0].strip() not in stdlib
+        ]
+        
+        # Re-runs on a prepared environment need no pip process or network at all
+        missing = find_missing_requirements(requirements)
+        if not missing:
+            with self.output_lock:
+                self.step("Installing dependencies...")
+                self.log("   ✅ All requirements already satisfied")
+            return
+        
+        env = os.environ.copy()
+        env['PIP_NO_INPUT'] = '1'
+        env['PIP_DISABLE_PIP_VERSION_CHECK'] = '1'
+        
+        # One installer process resolves and downloads the whole set over a shared session;
+        # uv fetches and unpacks wheels in parallel, so it is preferred when it is on PATH.
+        # Neither writes bytecode, it is compiled afterwards in a single parallel pass
+        uv = shutil.which('uv')
+        if uv:
+            pip_command = [uv, 'pip', 'install', '--python', sys.executable]
+        else:
+            pip_command = [sys.executable, '-m', 'pip', 'install', '--no-compile', '--prefer-binary']
+        
+        lock_path = self.base_dir / "requirements.lock"
+        if lock_path.exists():
+            # A hash-pinned lock already lists the full dependency tree, so the resolver is skipped
+            command = [*pip_command, '--no-deps', '--require-hashes', '-r', str(lock_path)]
+            returncode, output = self.run_pip(command, env)
+        else:
+            # Wheels only, so no dependency is compiled from source; retry with sdists
+            # allowed only if some pin has no wheel for this platform
+            command = [*pip_command, '--only-binary=:all:', *missing]
+            returncode, output = self.run_pip(command, env)
+            if returncode != 0 and any(marker in line for line in output for marker in NO_WHEEL_MARKERS):
+                command = [*pip_command, *missing]
+                returncode, output = self.run_pip(command, env)
+        
+        # Runs alongside the file steps, so the step is reported as one block once pip is done
+        lines = []
+        if returncode == 0:
+            installed = []
+            for line in output:
+                if line.startswith('Successfully installed'):
+                    installed.extend(line.split()[2:])
+                elif line.startswith(' + '):
+                    installed.append(line.split()[1])
+            
+            if installed:
+                lines.extend(f"   ✅ Installed {package}" for package in installed)
+                compileall.compile_dir(sysconfig.get_paths()['purelib'], quiet=2, workers=0)
+            else:
+                lines.append("   ✅ All requirements already satisfied")
+        else:
+            errors = [line for line in output if line.startswith('ERROR')] or output[-5:]
+            lines.append("   ❌ Dependency installation failed:\n" + "\n".join(errors))
+            
+            # Only after a bulk failure, retry one requirement at a time to pinpoint the culprit;
+            # a failed lock install is reported as is, since its entries cannot be installed unhashed
+            if len(missing) > 1 and not lock_path.exists():
+                for requirement in missing:
+                    single_returncode, _ = self.run_pip([*pip_command, requirement], env)
+                    status = "✅" if single_returncode == 0 else "❌"
+                    lines.append(f"   {status} {requirement}")
+        
+        with self.output_lock:
+            self.step("Installing dependencies...")
+            self.log("\n".join(lines))
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, "\n".join(output))
+    
+    def run_pip(self, command, env):
+        """Run pip, streaming its progress lines as they arrive, and return (returncode, output)"""
+        import subprocess
+        
+        output = []
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, env=env
+        )
+        with process:
+            for line in process.stdout:
+                line = line.rstrip()
+                output.append(line)
+                
+                # Progress is shown live even when the rest of the output is buffered
+                if line.startswith(PIP_PROGRESS_PREFIXES):
+                    with self.output_lock:
+                        print(f"   {line}", flush=True)
+        
+        return process.returncode, output
+    
+    def create_startup_scripts(self):
+        """Create startup scripts"""
+        self.step("Creating startup scripts...")
+        
+        # The Unix script is written executable
+        if self.write_files({
+            "scripts/start_windows.bat": WINDOWS_START_SCRIPT,
+            "scripts/start_unix.sh": (UNIX_START_SCRIPT, 0o755)
+        }):
+            self.log("   ✅ Created startup scripts")
+    
+    def create_documentation(self):
+        """Create documentation"""
+        self.step("Creating documentation...")
+        
+        readme_content = README_TEMPLATE.format(
+            project_name=self.project_name,
+            created=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        if self.write_files({"README.md": readme_content}):
+            self.log("   ✅ Created README.md")
+    
+    def run_final_checks(self):
+        """Run final system checks"""
+        self.step("Running final system checks...")
+        
+        # Check Python installation (this interpreter, so no subprocess is needed)
+        self.log(f"   ✅ Python: Python {platform.python_version()}")
+        
+        # Check required directories
+        required_dirs = ['frontend', 'backend', 'smart-contract', 'database']
+        for dir_name in required_dirs:
+            dir_path = self.base_dir / dir_name
+            if dir_path.exists():
+                self.log(f"   ✅ Directory: {dir_name}/")
+            else:
+                self.log(f"   ❌ Missing: {dir_name}/")
+        
+        # Check key files
+        key_files = [
+            'frontend/index.html',
+            'backend/backend_server.py', 
+            'smart-contract/fake-account-registry.clar',
+            'requirements.txt',
+            'README.md'
+        ]
+        
+        for file_path in key_files:
+            full_path = self.base_dir / file_path
+            if full_path.exists():
+                self.log(f"   ✅ File: {file_path}")
+            else:
+                self.log(f"   ❌ Missing: {file_path}")
+        
+        # Check the database through the connection create_database left open
+        try:
+            self.get_db_connection().execute("SELECT id FROM system_stats WHERE id = 1").fetchone()
+            self.log("   ✅ Database: database/blockchain_records.db")
+        except sqlite3.Error as e:
+            self.log(f"   ❌ Database check failed: {e}")
+    
+    def print_completion_message(self):
+        """Print final completion message"""
+        self.log(render_completion_message(str(self.base_dir), self.project_name))
         
     def deploy(self):
         """Run complete deployment"""
@@ -585,14 +937,25 @@ Happy detecting! 🛡'''
             self.print_header()
             
             self.create_project_structure()
-            self.create_frontend_files()
-            self.create_backend_files()
-            self.create_smart_contract()
-            self.create_configuration_files()
-            self.create_database()
             self.create_requirements()
-            self.create_startup_scripts()
-            self.create_documentation()
+            
+            # pip is network-bound, so the file and database steps run while it installs
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                install = executor.submit(self.install_dependencies) if self.install else None
+                
+                self.create_frontend_files()
+                self.create_backend_files()
+                self.create_smart_contract()
+                self.create_configuration_files()
+                self.create_database()
+                self.create_startup_scripts()
+                self.create_documentation()
+                
+                if install is not None:
+                    # Show the finished steps while waiting on pip
+                    self.flush_output()
+                    install.result()
+            
             self.run_final_checks()
             
             self.print_completion_message()
@@ -600,31 +963,32 @@ Happy detecting! 🛡'''
             return True
             
         except Exception as e:
-            print(f"\n❌ Deployment failed: {e}")
-            print("Please check the error and try again.")
+            self.log(f"\n❌ Deployment failed: {e}")
+            self.log("Please check the error and try again.")
             return False
         except KeyboardInterrupt:
-            print("\n❌ Deployment interrupted by user")
+            self.log("\n❌ Deployment interrupted by user")
             return False
+        finally:
+            self.close_db_connection()
+            self.flush_output()
 
 def main():
     """Main deployment function"""
     if len(sys.argv) > 1 and sys.argv[1] == '--help':
-        print("ITBP Fake Account Detection System Deployment")
-        print("Usage: python deploy.py")
-        print("This script creates the complete project structure and basic files.")
+        print(USAGE_TEXT, end="")
         return
     
-    deployer = ITBPSystemDeployment()
+    deployer = ITBPSystemDeployment(
+        install='--install' in sys.argv[1:],
+        verbose='--verbose' in sys.argv[1:],
+        force='--force' in sys.argv[1:]
+    )
     success = deployer.deploy()
     
     if success:
-        print(f"\nTo start the system:")
-        print(f"cd {deployer.project_name}")
-        if os.name == 'nt':
-            print("scripts\\start_windows.bat")
-        else:
-            print("./scripts/start_unix.sh")
+        start_script = "scripts\\start_windows.bat" if os.name == 'nt' else "./scripts/start_unix.sh"
+        print(f"\nTo start the system:\ncd {deployer.project_name}\n{start_script}")
     
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,26 @@
+# gunicorn.conf.py - Production server settings for backend_server
+# Usage: gunicorn -c gunicorn.conf.py backend_server:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# (2 x CPU) + 1 worker processes
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Threaded workers overlap SQLite and notification I/O while keeping the
+# per-thread database connections long-lived. RandomForest inference is
+# CPU-bound, so greenlet-based workers would not speed it up.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Load the app once in the master so workers share the trained model pages
+preload_app = True
+
+def on_starting(server):
+    """Initialize the database and ML models before workers are forked"""
+    from backend_server import init_database, ml_detector
+    
+    init_database()
+    if not ml_detector.is_trained:
+        ml_detector.train_models()